@@ -203,6 +203,44 @@ DEFAULT_OLLAMA_MODEL = "cas/mistral-7b-instruct-v0.3"
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", DEFAULT_EMBEDDING_MODEL)
 RERANKER_MODEL = os.getenv("RERANK_MODEL", DEFAULT_RERANKER_MODEL)
 
+
+def _parse_reranker_quant(raw: str) -> str:
+    """Parse QA_RERANKER_QUANT; only "int8" is supported, anything else warns and keeps FP32."""
+    quant = raw.strip().lower()
+    if quant not in ("", "int8"):
+        logging.warning("Unsupported value for QA_RERANKER_QUANT: '%s'. Supported: 'int8'; using FP32 torch.", raw)
+        return ""
+    return quant
+
+
+# Reranker quantization: "int8" loads the INT8 ONNX export shipped in the model repo.
+# Needs optimum + onnxruntime (`sentence-transformers[onnx]`), which are deliberately not
+# declared as project dependencies; install them into the environment to use it.
+RERANKER_QUANT = _parse_reranker_quant(os.getenv("QA_RERANKER_QUANT", ""))
+RERANKER_INT8_ONNX_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Opt-in torch.compile of the reranker; the first predict() after load pays the compile warm-up.
+RERANKER_COMPILE = os.getenv("QA_RERANKER_COMPILE", "0").lower() in ("1", "true", "yes")
+
+
+def _parse_torch_threads(raw: str) -> int | None:
+    """Parse QA_TORCH_THREADS; unset or invalid (non-integer, <= 0) means "leave torch alone"."""
+    if not raw:
+        return None
+    try:
+        threads = int(raw)
+    except ValueError:
+        threads = 0
+    if threads <= 0:
+        logging.warning("Invalid value for QA_TORCH_THREADS: '%s'. Expected a positive integer; ignoring.", raw)
+        return None
+    return threads
+
+
+# Opt-in override of torch's process-wide intra-op CPU thread count (also affects the
+# embedder). Unset keeps torch's default of one thread per physical core.
+TORCH_THREADS = _parse_torch_threads(os.getenv("QA_TORCH_THREADS", "").strip())
+
 # Ollama LLM settings (used by qa_loop.py)
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", DEFAULT_OLLAMA_MODEL)
 
@@ -9,6 +9,8 @@ This module provides a straightforward way to load and cache ML models:
 
 from __future__ import annotations
 
+import functools
+
 # For manual vectorization - proper type annotations
 from typing import TYPE_CHECKING, Any
 
@@ -22,13 +24,18 @@ logger = get_logger(__name__)
 
 # Module-level cache to avoid reloading models
 _embedding_model: Any = None
-_cross_encoder: Any = None
+# torch thread pools are process-wide; configure them only once
+_threads_configured = False
 
 
 # Import model configuration from central config
 from backend.config import (
     EMBEDDING_MODEL,
+    RERANKER_COMPILE,
+    RERANKER_INT8_ONNX_FILE,
     RERANKER_MODEL,
+    RERANKER_QUANT,
+    TORCH_THREADS,
 )
 
 # Configuration is imported directly from config.py
@@ -45,15 +52,50 @@ def load_embedder() -> "SentenceTransformer":
     return _embedding_model
 
 
+@functools.lru_cache(maxsize=1)
 def load_reranker() -> "CrossEncoder":
-    """Load the reranker model with HuggingFace caching."""
-    global _cross_encoder
-    if _cross_encoder is not None:
-        return _cross_encoder
-
-    _cross_encoder = load_model(RERANKER_MODEL, is_embedding=False)
+    """Load the reranker model with HuggingFace caching (cached; reset via ``cache_clear()``)."""
+    cross_encoder = load_model(RERANKER_MODEL, is_embedding=False)
+    _configure_torch_threads()
+    if RERANKER_COMPILE:
+        cross_encoder = _compile_reranker(cross_encoder)
     logger.debug("Reranker model loaded and cached successfully")
-    return _cross_encoder
+    return cross_encoder
+
+
+def _configure_torch_threads() -> None:
+    """Apply QA_TORCH_THREADS to torch's intra-op pool once; unset leaves torch's default."""
+    global _threads_configured
+    if _threads_configured or TORCH_THREADS is None:
+        return
+
+    import torch
+
+    # Process-wide: the embedder shares this pool with the reranker.
+    torch.set_num_threads(TORCH_THREADS)
+    _threads_configured = True
+    logger.debug("torch intra-op threads set to %d", TORCH_THREADS)
+
+
+def _compile_reranker(cross_encoder: Any) -> Any:
+    """Return the reranker compiled with torch.compile (QA_RERANKER_COMPILE=1), or an eager one.
+
+    ``compile()`` is lazy: Inductor only builds kernels (and fails, e.g. without a C++
+    compiler) on the first forward pass. A warm-up ``predict`` therefore runs inside the
+    guard, and on any failure the model is reloaded uncompiled so later predict() calls
+    never hit the error. ``dynamic=True`` lets one compiled graph serve every pair length.
+    """
+    if RERANKER_QUANT == "int8":
+        logger.info("QA_RERANKER_COMPILE ignored for the ONNX reranker backend")
+        return cross_encoder
+    try:
+        cross_encoder.compile(dynamic=True)
+        cross_encoder.predict([("warm-up query", "warm-up passage")], show_progress_bar=False)
+    except Exception as e:
+        logger.warning("torch.compile failed for reranker, reloading in eager mode: %s", e)
+        return load_model(RERANKER_MODEL, is_embedding=False)
+    logger.info("Reranker compiled with torch.compile")
+    return cross_encoder
 
 
 def preload_models() -> None:
@@ -64,6 +106,13 @@ def preload_models() -> None:
     logger.debug("All models preloaded successfully")
 
 
+def _reranker_backend_kwargs() -> dict[str, Any]:
+    """CrossEncoder kwargs for the configured backend (INT8 ONNX when QA_RERANKER_QUANT=int8)."""
+    if RERANKER_QUANT == "int8":
+        return {"backend": "onnx", "model_kwargs": {"file_name": RERANKER_INT8_ONNX_FILE}}
+    return {}
+
+
 def load_model(model_name: str, is_embedding: bool) -> Any:
     """
     Load model using HuggingFace's built-in caching mechanism.
@@ -89,7 +138,7 @@ def load_model(model_name: str, is_embedding: bool) -> Any:
         else:
             from sentence_transformers.cross_encoder import CrossEncoder
 
-            return CrossEncoder(model_name)
+            return CrossEncoder(model_name, **_reranker_backend_kwargs())
 
     except ImportError as e:
         error_msg = "sentence-transformers not available. Install with: make uv-sync-test"
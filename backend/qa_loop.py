@@ -7,8 +7,12 @@ repo-root `cli.py` — this module is no longer invoked directly."""
 # External libraries
 from __future__ import annotations
 
+import heapq
+import math
 import os
 import threading
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Callable, List, Optional, Tuple
 
@@ -24,15 +28,21 @@ logger = get_logger(__name__)
 
 # Constants
 MAX_RETRIES = 3
+_RERANK_CACHE_MAX = 4096
 
 
 # ---------- cross-encoder helpers --------------------------------------------------
 @dataclass
 class ScoredChunk:
-    """A context *chunk* paired with its relevance *score*."""
+    """A context *chunk* paired with its relevance *score* (NaN when reranking was skipped)."""
 
     text: str
-    score: float
+    score: float = math.nan
+
+    @property
+    def is_scored(self) -> bool:
+        """False for chunks kept in retriever order without a cross-encoder score."""
+        return not math.isnan(self.score)
 
 
 # Note: Do not eagerly check/import heavy deps at module import time. We'll lazily
@@ -43,6 +53,27 @@ _ollama_context: list[int] | None = None
 
 # ✅ Re-ranking of retrieved chunks implemented below using a cross-encoder (sentence-transformers).
 
+# Per-encoder LRU caches of cross-encoder scores keyed by (hash(question), hash(chunk)), so
+# repeated or overlapping questions skip the transformer forward pass for pairs already
+# scored. Each cache is owned by (weakly keyed on) the encoder instance that produced its
+# scores: a different model, or a reload after load_reranker.cache_clear(), starts empty.
+_rerank_caches: weakref.WeakKeyDictionary[Any, OrderedDict[tuple[int, int], float]] = weakref.WeakKeyDictionary()
+_rerank_cache_lock = threading.Lock()
+
+
+def clear_rerank_cache() -> None:
+    """Drop every cached reranker score (e.g. between datasets or in tests)."""
+    with _rerank_cache_lock:
+        _rerank_caches.clear()
+
+
+def _cache_for(cross_encoder: Any) -> OrderedDict[tuple[int, int], float] | None:
+    """Return *cross_encoder*'s score cache (caller holds the lock); None if it can't be weakly keyed."""
+    try:
+        return _rerank_caches.setdefault(cross_encoder, OrderedDict())
+    except TypeError:
+        return None
+
 
 # ---------- Cross-encoder helpers --------------------------------------------------
 def _get_cross_encoder() -> Any:
@@ -54,33 +85,124 @@ def _get_cross_encoder() -> Any:
         return None
 
 
-def _score_chunks(question: str, chunks: List[str], cross_encoder: Any) -> List[ScoredChunk]:
+def _score_pairs(pairs: List[Tuple[str, str]], cross_encoder: Any, **predict_kwargs: Any) -> List[float]:
+    """Return a cross-encoder score per (question, chunk) pair, consulting *cross_encoder*'s score cache.
+
+    Only pairs missing from the cache reach ``predict`` (in one call); *predict_kwargs*
+    are forwarded to it.
+    """
+    keys = [(hash(q), hash(c)) for q, c in pairs]
+    with _rerank_cache_lock:
+        cache = _cache_for(cross_encoder)
+        cached = {} if cache is None else {key: cache[key] for key in keys if key in cache}
+    misses = [i for i, key in enumerate(keys) if key not in cached]
+
+    if misses:
+        logger.debug("Scoring %d of %d pairs using cross-encoder.", len(misses), len(pairs))
+        scores = cross_encoder.predict([pairs[i] for i in misses], **predict_kwargs)  # logits, pos > relevant
+        for i, s in zip(misses, scores):
+            cached[keys[i]] = float(s)
+
+    if cache is not None:
+        with _rerank_cache_lock:
+            for key in keys:
+                cache[key] = cached[key]
+                cache.move_to_end(key)
+            while len(cache) > _RERANK_CACHE_MAX:
+                cache.popitem(last=False)
+
+    return [cached[key] for key in keys]
+
+
+def _score_chunks(
+    question: str,
+    chunks: List[str],
+    cross_encoder: Any,
+    batch_size: int = 32,
+    show_progress: bool = False,
+) -> List[ScoredChunk]:
     """Return *chunks* each paired with a relevance score for *question*.
 
-    Uses CrossEncoder for scoring. Raises RuntimeError if CrossEncoder is not available.
+    Uses CrossEncoder for scoring; only pairs missing from the score cache reach
+    ``predict``. Raises RuntimeError if CrossEncoder is not available.
     """
     if cross_encoder is None:
         raise RuntimeError("CrossEncoder model is not available. Ensure the model is downloaded and accessible.")
 
-    logger.debug("Scoring chunks using cross-encoder.")
     pairs: List[Tuple[str, str]] = [(question, c) for c in chunks]
-    scores = cross_encoder.predict(pairs)  # logits, pos > relevant
-    return [ScoredChunk(text=c, score=float(s)) for c, s in zip(chunks, scores)]
+    scores = _score_pairs(pairs, cross_encoder, batch_size=batch_size, show_progress_bar=show_progress)
+    return [ScoredChunk(text=c, score=s) for c, s in zip(chunks, scores)]
 
 
 # ---------- Reranking of retrieved chunks --------------------------------------------------
-def _rerank(question: str, chunks: List[str], k_keep: int, cross_encoder: Any) -> List[ScoredChunk]:
-    """Return the top *k_keep* chunks from *chunks* after re-ranking by relevance to *question*."""
+def _rerank(
+    question: str,
+    chunks: List[str],
+    k_keep: int,
+    cross_encoder: Any,
+    batch_size: int = 32,
+    show_progress: bool = False,
+) -> List[ScoredChunk]:
+    """Return the top *k_keep* chunks from *chunks* after re-ranking by relevance to *question*.
+
+    *batch_size* and *show_progress* are passed to ``CrossEncoder.predict``.
+    """
 
     if not chunks:
         return []
 
+    if cross_encoder is None:
+        raise RuntimeError("CrossEncoder model is not available. Ensure the model is downloaded and accessible.")
+
+    # Every chunk survives the cut, so scoring would only reorder them: keep the
+    # retriever's (hybrid-relevance) order and skip the transformer entirely.
+    if len(chunks) <= k_keep:
+        logger.debug("Skipping cross-encoder: %d chunks <= k_keep=%d, keeping retriever order.", len(chunks), k_keep)
+        return [ScoredChunk(text=c) for c in chunks]
+
     # Score all chunks
-    scored_chunks = _score_chunks(question, chunks, cross_encoder)
+    scored_chunks = _score_chunks(question, chunks, cross_encoder, batch_size=batch_size, show_progress=show_progress)
+
+    # Keep the top k by score (higher = more relevant): O(n log k) instead of a full sort,
+    # and stable on ties like sorted(..., reverse=True)[:k].
+    return heapq.nlargest(k_keep, scored_chunks, key=lambda sc: sc.score)
+
+
+def _rerank_batch(
+    questions: List[str],
+    chunk_lists: List[List[str]],
+    k_keep: int,
+    cross_encoder: Any,
+    batch_size: int = 128,
+) -> List[List[ScoredChunk]]:
+    """Re-rank several questions' chunks with a single ``predict`` call.
+
+    Same per-question result as :func:`_rerank`, but every (question, chunk) pair is
+    flattened into one call so the transformer sees full *batch_size* batches instead of
+    one partial batch per question; scores are sliced back per question by offset.
+    Raises ValueError if *questions* and *chunk_lists* differ in length.
+    """
+    if len(questions) != len(chunk_lists):
+        raise ValueError(f"Got {len(questions)} questions but {len(chunk_lists)} chunk lists; they must pair up.")
+
+    # Lists that fit within k_keep keep retriever order unscored, as in _rerank.
+    results = [[ScoredChunk(text=c) for c in chunks] for chunks in chunk_lists]
+    to_score = [i for i, chunks in enumerate(chunk_lists) if len(chunks) > k_keep]
+    pairs = [(questions[i], c) for i in to_score for c in chunk_lists[i]]
+    if not pairs:
+        return results
+
+    if cross_encoder is None:
+        raise RuntimeError("CrossEncoder model is not available. Ensure the model is downloaded and accessible.")
 
-    # Sort by score (higher = more relevant) and keep top k
-    scored_chunks.sort(key=lambda sc: sc.score, reverse=True)
-    return scored_chunks[:k_keep]
+    scores = _score_pairs(pairs, cross_encoder, batch_size=batch_size, show_progress_bar=False)
+    offset = 0
+    for i in to_score:
+        chunks = chunk_lists[i]
+        scored = [ScoredChunk(text=c, score=s) for c, s in zip(chunks, scores[offset : offset + len(chunks)])]
+        results[i] = heapq.nlargest(k_keep, scored, key=lambda sc: sc.score)
+        offset += len(chunks)
+    return results
 
 
 # ---------- Prompt building --------------------------------------------------
@@ -150,7 +272,10 @@ def answer(
     logger.debug("Reranked context chunks:")
     for idx, sc in enumerate(scored_chunks, 1):
         preview = sc.text.replace("\n", " ")[:120]
-        logger.debug(" %02d. score=%.4f | %s…", idx, sc.score, preview)
+        if sc.is_scored:
+            logger.debug(" %02d. score=%.4f | %s…", idx, sc.score, preview)
+        else:
+            logger.debug(" %02d. unscored (retriever order) | %s…", idx, preview)
 
     # Extract plain texts for prompt construction.
     context_chunks = [sc.text for sc in scored_chunks]
@@ -14,7 +14,6 @@ from backend.ingest import ingest
 from backend.qa_loop import ensure_weaviate_ready_and_populated
 from backend.weaviate_client import close_weaviate_client, get_weaviate_client
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 pytest_plugins = ["tests.e2e.conftest"]
@@ -41,7 +41,7 @@ def reset_global_cache():
     import backend.models
 
     backend.models._embedding_model = None
-    backend.models._cross_encoder = None
+    backend.models.load_reranker.cache_clear()
     yield
     # Cleanup happens automatically in the next test
 
@@ -140,7 +140,7 @@ def test_preload_models_functionality(reset_global_cache):
     import backend.models
 
     assert backend.models._embedding_model is None, "Embedding model should not be loaded initially"
-    assert backend.models._cross_encoder is None, "Reranker model should not be loaded initially"
+    assert backend.models.load_reranker.cache_info().currsize == 0, "Reranker model should not be loaded initially"
 
     # Preload models
     try:
@@ -150,14 +150,17 @@ def test_preload_models_functionality(reset_global_cache):
 
     # Verify both models are now loaded
     assert backend.models._embedding_model is not None, "Embedding model should be loaded after preload"
-    assert backend.models._cross_encoder is not None, "Reranker model should be loaded after preload"
+    assert backend.models.load_reranker.cache_info().currsize == 1, "Reranker model should be loaded after preload"
 
     # Test that individual load functions return the preloaded models
     embedder = load_embedder()
     reranker = load_reranker()
 
     assert embedder is backend.models._embedding_model, "load_embedder should return preloaded model"
-    assert reranker is backend.models._cross_encoder, "load_reranker should return preloaded model"
+    # A single cache miss means preload did the only load and this call was a cache hit.
+    assert reranker is not None and backend.models.load_reranker.cache_info().misses == 1, (
+        "load_reranker should return preloaded model"
+    )
 
     logger.info("Preload functionality validated successfully")
 
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
 import pytest
 
 
@@ -46,24 +50,39 @@ def _enforce_blocked_sockets(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(_socket, "create_connection", _blocked_create_connection, raising=True)
 
 
-from unittest.mock import MagicMock
-
-
 @pytest.fixture
 def mock_embedding_model(mocker) -> MagicMock:
-    """Fixture to mock the SentenceTransformer, preventing model downloads."""
+    """Fixture to mock the SentenceTransformer, preventing model downloads.
+
+    ``encode`` returns a real ndarray, as in production, so its ``tolist()`` is the
+    C method rather than a per-test MagicMock.
+    """
     mock = MagicMock()
+    mock.encode.return_value = np.array([0.1, 0.2, 0.3])
     # Patch at the retriever level where load_embedder is actually called
     mocker.patch("backend.retriever.load_embedder", return_value=mock)
     return mock
 
 
 @pytest.fixture
-def managed_cross_encoder(mocker):
-    """Fixture to mock the CrossEncoder class, returning a MagicMock instance."""
-    mock_encoder_instance = MagicMock()
-    mocker.patch("backend.qa_loop.load_reranker", return_value=mock_encoder_instance)
-    yield mock_encoder_instance
+def weaviate_mock(mocker) -> SimpleNamespace:
+    """Weaviate client/collection/query chain wired once for retriever tests.
+
+    Tests only set ``query.hybrid`` / ``query.bm25`` behaviour; ``Object`` builds a
+    result object exposing ``properties["content"]``.
+    """
+    client, collection, query = MagicMock(), MagicMock(), MagicMock()
+    mocker.patch("backend.weaviate_client.get_weaviate_client", return_value=client)
+    client.collections.get.return_value = collection
+    collection.query = query
+
+    class Obj:
+        __slots__ = ("properties",)
+
+        def __init__(self, content: str) -> None:
+            self.properties = {"content": content}
+
+    return SimpleNamespace(client=client, collection=collection, query=query, Object=Obj)
 
 
 @pytest.fixture(autouse=True)
@@ -20,7 +20,7 @@ def test_answer_streams_raw_tokens_and_returns_trimmed():
 
     # Mock the reranker: the real model can't load under the unit tier's socket block.
     cross_encoder = MagicMock()
-    cross_encoder.predict.side_effect = lambda pairs: [1.0] * len(pairs)
+    cross_encoder.predict.side_effect = lambda pairs, **kwargs: [1.0] * len(pairs)
 
     streamed: list[str] = []
     with (
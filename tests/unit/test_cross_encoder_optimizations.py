@@ -1,3 +1,8 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
 from backend import qa_loop
 
 
@@ -10,3 +15,129 @@ def test_get_cross_encoder_returns_none_on_load_failure(mocker):
     mocker.patch("backend.qa_loop.load_reranker", side_effect=RuntimeError("model unavailable"))
 
     assert qa_loop._get_cross_encoder() is None
+
+
+def test_int8_quant_loads_quantized_onnx_export(mocker):
+    """QA_RERANKER_QUANT=int8 selects the ONNX backend and the INT8 VNNI export file."""
+    from backend import models
+
+    mocker.patch.object(models, "RERANKER_QUANT", "int8")
+    cross_encoder_cls = mocker.patch("sentence_transformers.cross_encoder.CrossEncoder")
+
+    models.load_model("cross-encoder/test", is_embedding=False)
+
+    cross_encoder_cls.assert_called_once_with(
+        "cross-encoder/test",
+        backend="onnx",
+        model_kwargs={"file_name": models.RERANKER_INT8_ONNX_FILE},
+    )
+
+
+def test_default_quant_keeps_torch_backend(mocker):
+    """Without QA_RERANKER_QUANT the reranker loads with CrossEncoder defaults (FP32 torch)."""
+    from backend import models
+
+    mocker.patch.object(models, "RERANKER_QUANT", "")
+    cross_encoder_cls = mocker.patch("sentence_transformers.cross_encoder.CrossEncoder")
+
+    models.load_model("cross-encoder/test", is_embedding=False)
+
+    cross_encoder_cls.assert_called_once_with("cross-encoder/test")
+
+
+@pytest.mark.parametrize(("raw", "expected"), [("", ""), ("int8", "int8"), (" INT8 ", "int8"), ("fp16", "")])
+def test_parse_reranker_quant_only_accepts_int8(raw, expected, caplog):
+    """Unrecognised QA_RERANKER_QUANT values fall back to FP32 with a warning, not silently."""
+    from backend.config import _parse_reranker_quant
+
+    with caplog.at_level(logging.WARNING):
+        assert _parse_reranker_quant(raw) == expected
+    assert any("QA_RERANKER_QUANT" in r.getMessage() for r in caplog.records) == (raw == "fp16")
+
+
+def test_torch_threads_configured_once(mocker):
+    """An explicit QA_TORCH_THREADS is applied on the first reranker load only."""
+    from backend import models
+
+    mocker.patch.object(models, "_threads_configured", False)
+    mocker.patch.object(models, "TORCH_THREADS", 4)
+    set_threads = mocker.patch("torch.set_num_threads")
+    set_interop = mocker.patch("torch.set_num_interop_threads")
+
+    models._configure_torch_threads()
+    models._configure_torch_threads()
+
+    set_threads.assert_called_once_with(4)
+    set_interop.assert_not_called()
+
+
+def test_torch_threads_untouched_by_default(mocker):
+    """Without QA_TORCH_THREADS torch keeps its own thread-pool sizing."""
+    from backend import models
+
+    mocker.patch.object(models, "_threads_configured", False)
+    mocker.patch.object(models, "TORCH_THREADS", None)
+    set_threads = mocker.patch("torch.set_num_threads")
+
+    models._configure_torch_threads()
+
+    set_threads.assert_not_called()
+
+
+@pytest.mark.parametrize(("raw", "expected"), [("", None), ("4", 4), ("0", None), ("-2", None), ("many", None)])
+def test_parse_torch_threads_rejects_non_positive(raw, expected):
+    """QA_TORCH_THREADS must be a positive integer; anything else leaves torch's default."""
+    from backend.config import _parse_torch_threads
+
+    assert _parse_torch_threads(raw) == expected
+
+
+def test_torch_threads_retried_after_failure(mocker):
+    """A failed set_num_threads doesn't mark the pool as configured."""
+    from backend import models
+
+    mocker.patch.object(models, "_threads_configured", False)
+    mocker.patch.object(models, "TORCH_THREADS", 4)
+    mocker.patch("torch.set_num_threads", side_effect=RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError):
+        models._configure_torch_threads()
+    assert models._threads_configured is False
+
+
+def test_compile_reranker_warms_up_compiled_model(mocker):
+    """Compilation uses dynamic shapes and is exercised by a warm-up predict() at load."""
+    from backend import models
+
+    mocker.patch.object(models, "RERANKER_QUANT", "")
+    cross_encoder = MagicMock()
+
+    assert models._compile_reranker(cross_encoder) is cross_encoder
+    cross_encoder.compile.assert_called_once_with(dynamic=True)
+    cross_encoder.predict.assert_called_once()
+
+
+def test_compile_reranker_falls_back_to_eager_on_failure(mocker):
+    """compile() is lazy; a failing warm-up forward swaps in a freshly loaded eager model."""
+    from backend import models
+
+    mocker.patch.object(models, "RERANKER_QUANT", "")
+    eager = MagicMock()
+    load_model = mocker.patch.object(models, "load_model", return_value=eager)
+    cross_encoder = MagicMock()
+    cross_encoder.predict.side_effect = RuntimeError("InvalidCxxCompiler")
+
+    assert models._compile_reranker(cross_encoder) is eager
+    load_model.assert_called_once_with(models.RERANKER_MODEL, is_embedding=False)
+    eager.compile.assert_not_called()
+
+
+def test_compile_reranker_skips_onnx_backend(mocker):
+    """The INT8 ONNX reranker has no torch graph to compile; it is returned untouched."""
+    from backend import models
+
+    mocker.patch.object(models, "RERANKER_QUANT", "int8")
+    cross_encoder = MagicMock()
+
+    assert models._compile_reranker(cross_encoder) is cross_encoder
+    cross_encoder.compile.assert_not_called()
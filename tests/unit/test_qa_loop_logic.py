@@ -1,5 +1,5 @@
 import logging
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -10,32 +10,162 @@ from backend import qa_loop
 logger = logging.getLogger(__name__)
 
 
-def test_rerank_cross_encoder_success(managed_cross_encoder: MagicMock):
+class _StubEncoder:
+    """Lightweight CrossEncoder stand-in (hashable by identity, like the real model).
+
+    Each ``predict`` call returns the next batch from *score_batches*; the pairs and
+    keyword arguments it was called with are recorded in ``.calls`` / ``.call_kwargs``.
+    """
+
+    __slots__ = ("_batches", "calls", "call_kwargs", "__weakref__")
+
+    def __init__(self, *score_batches: list[float]) -> None:
+        self._batches = iter(score_batches)
+        self.calls: list[list[tuple[str, str]]] = []
+        self.call_kwargs: list[dict] = []
+
+    def predict(self, pairs, **kwargs):
+        self.calls.append(list(pairs))
+        self.call_kwargs.append(kwargs)
+        return next(self._batches)
+
+
+def test_rerank_cross_encoder_success():
     """Test reranking with a successful cross-encoder prediction."""
     logger.debug("--- Running test_rerank_cross_encoder_success ---")
-    managed_cross_encoder.predict.return_value = [0.9, 0.1]
+    cross_encoder = _StubEncoder([0.1, 0.9, 0.5])
 
-    chunks = ["relevant", "irrelevant"]
+    chunks = ["irrelevant", "relevant", "related"]
     question = "test query"
 
-    result = qa_loop._rerank(question, chunks, k_keep=2, cross_encoder=managed_cross_encoder)
+    result = qa_loop._rerank(question, chunks, k_keep=2, cross_encoder=cross_encoder)
 
     assert len(result) == 2
     assert result[0].text == "relevant"
     assert result[0].score == 0.9
-    assert result[1].text == "irrelevant"
-    assert result[1].score == 0.1
-    managed_cross_encoder.predict.assert_called_once()
+    assert result[1].text == "related"
+    assert result[1].score == 0.5
+    assert len(cross_encoder.calls) == 1
+
+
+def test_rerank_forwards_predict_options():
+    """batch_size/show_progress reach CrossEncoder.predict (progress bar off by default)."""
+    default_encoder = _StubEncoder([0.2, 0.8])
+    custom_encoder = _StubEncoder([0.2, 0.8])
+
+    qa_loop._rerank("test query", ["a", "b"], k_keep=1, cross_encoder=default_encoder)
+    qa_loop._rerank("test query", ["a", "b"], k_keep=1, cross_encoder=custom_encoder, batch_size=8, show_progress=True)
+
+    assert default_encoder.call_kwargs == [{"batch_size": 32, "show_progress_bar": False}]
+    assert custom_encoder.call_kwargs == [{"batch_size": 8, "show_progress_bar": True}]
 
 
-def test_rerank_empty_chunks_list(managed_cross_encoder: MagicMock):
+def test_rerank_empty_chunks_list():
     """Test that reranking with an empty list of chunks returns an empty list."""
-    result = qa_loop._rerank("test query", [], k_keep=2, cross_encoder=managed_cross_encoder)
+    cross_encoder = _StubEncoder()
+    result = qa_loop._rerank("test query", [], k_keep=2, cross_encoder=cross_encoder)
     assert result == []
-    managed_cross_encoder.predict.assert_not_called()
+    assert cross_encoder.calls == []
+
+
+def test_rerank_short_circuits_when_k_ge_len():
+    """When every chunk is kept, predict() is skipped and retriever order is preserved."""
+    cross_encoder = _StubEncoder()
+    result = qa_loop._rerank("test query", ["first", "second"], k_keep=2, cross_encoder=cross_encoder)
+
+    assert [sc.text for sc in result] == ["first", "second"]
+    assert not any(sc.is_scored for sc in result)
+    assert cross_encoder.calls == []
+
+
+def test_rerank_prediction_failure_propagates():
+    """A predict() failure surfaces to the caller instead of yielding made-up scores."""
+
+    def _fail(pairs, **kwargs):
+        raise Exception("Model prediction failure")
+
+    with pytest.raises(Exception, match="Model prediction failure"):
+        qa_loop._rerank("test query", ["a", "b"], k_keep=1, cross_encoder=SimpleNamespace(predict=_fail))
 
 
 def test_rerank_model_load_failure_raises_runtime_error():
     """Test that a RuntimeError is raised if the CrossEncoder is not available."""
     with pytest.raises(RuntimeError, match="CrossEncoder model is not available"):
         qa_loop._rerank("test query", ["chunk1"], k_keep=1, cross_encoder=None)
+
+
+def test_rerank_reuses_cached_scores():
+    """Pairs scored once are served from the cache; only new chunks reach predict()."""
+    cross_encoder = _StubEncoder([0.9, 0.1], [0.5])
+    qa_loop._rerank("test query", ["relevant", "irrelevant"], k_keep=1, cross_encoder=cross_encoder)
+    result = qa_loop._rerank("test query", ["relevant", "new", "irrelevant"], k_keep=2, cross_encoder=cross_encoder)
+
+    assert cross_encoder.calls[1] == [("test query", "new")]
+    assert [(sc.text, sc.score) for sc in result] == [("relevant", 0.9), ("new", 0.5)]
+
+
+def test_rerank_cache_is_per_encoder():
+    """Scores cached for one model are never served for another (e.g. after a reload)."""
+    first = _StubEncoder([0.9, 0.1])
+    second = _StubEncoder([0.2, 0.7])
+    qa_loop._rerank("test query", ["a", "b"], k_keep=1, cross_encoder=first)
+    result = qa_loop._rerank("test query", ["a", "b"], k_keep=1, cross_encoder=second)
+
+    assert len(second.calls) == 1
+    assert [(sc.text, sc.score) for sc in result] == [("b", 0.7)]
+
+
+def test_clear_rerank_cache_forces_rescoring():
+    """After clear_rerank_cache() the same pairs are scored again."""
+    cross_encoder = _StubEncoder([0.9, 0.1], [0.9, 0.1])
+    qa_loop._rerank("test query", ["relevant", "irrelevant"], k_keep=1, cross_encoder=cross_encoder)
+    qa_loop.clear_rerank_cache()
+    qa_loop._rerank("test query", ["relevant", "irrelevant"], k_keep=1, cross_encoder=cross_encoder)
+
+    assert len(cross_encoder.calls) == 2
+
+
+def test_rerank_batch_uses_one_predict_call():
+    """Three questions are scored in a single predict() call and split back per question."""
+    cross_encoder = _StubEncoder([0.1, 0.9, 0.8, 0.2, 0.3, 0.7])
+
+    results = qa_loop._rerank_batch(
+        ["q1", "q2", "q3"],
+        [["a", "b"], ["c", "d"], ["e", "f"]],
+        k_keep=1,
+        cross_encoder=cross_encoder,
+    )
+
+    assert len(cross_encoder.calls) == 1
+    assert len(cross_encoder.calls[0]) == 6
+    assert [[(sc.text, sc.score) for sc in r] for r in results] == [[("b", 0.9)], [("c", 0.8)], [("f", 0.7)]]
+
+
+def test_rerank_batch_mixes_short_circuited_and_scored_lists():
+    """Short lists stay unscored while the scored lists' slices line up with their offsets."""
+    cross_encoder = _StubEncoder([0.1, 0.9, 0.8, 0.2])
+
+    results = qa_loop._rerank_batch(
+        ["q1", "q2", "q3"],
+        [["a", "b"], ["only"], ["c", "d"]],
+        k_keep=1,
+        cross_encoder=cross_encoder,
+    )
+
+    assert cross_encoder.calls == [[("q1", "a"), ("q1", "b"), ("q3", "c"), ("q3", "d")]]
+    assert [(sc.text, sc.score) for sc in results[0]] == [("b", 0.9)]
+    assert [sc.text for sc in results[1]] == ["only"] and not results[1][0].is_scored
+    assert [(sc.text, sc.score) for sc in results[2]] == [("c", 0.8)]
+
+
+def test_rerank_batch_rejects_mismatched_lengths():
+    """Every chunk list needs its own question; a mismatch is a caller error, not a silent drop."""
+    with pytest.raises(ValueError, match="3 questions but 1 chunk lists"):
+        qa_loop._rerank_batch(["q1", "q2", "q3"], [["a", "b"]], k_keep=1, cross_encoder=_StubEncoder())
+
+
+def test_rerank_batch_without_encoder_needs_nothing_scored():
+    """Like _rerank, a missing encoder only matters when some list actually needs scoring."""
+    assert qa_loop._rerank_batch(["q"], [[]], k_keep=1, cross_encoder=None) == [[]]
+    with pytest.raises(RuntimeError, match="CrossEncoder model is not available"):
+        qa_loop._rerank_batch(["q"], [["a", "b"]], k_keep=1, cross_encoder=None)
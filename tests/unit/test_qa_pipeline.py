@@ -29,7 +29,7 @@ def test_qa_pipeline_produces_answer():
 
     # Mock the reranker: the real model can't load under the unit tier's socket block.
     cross_encoder = MagicMock()
-    cross_encoder.predict.side_effect = lambda pairs: [1.0] * len(pairs)
+    cross_encoder.predict.side_effect = lambda pairs, **kwargs: [1.0] * len(pairs)
     with (
         patch("backend.qa_loop.get_top_k", mock_get_top_k),
         patch("backend.qa_loop.generate_response", mock_generate_response),
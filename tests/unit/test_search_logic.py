@@ -1,125 +1,80 @@
 #!/usr/bin/env python3
 """Test to verify hybrid search works with manual vectorization."""
 
-import os
+import logging
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-import numpy as np
 import pytest
+from weaviate.exceptions import WeaviateQueryError
 
-# Disable torch.compile during these mocked tests to avoid unnecessary compile overhead
-os.environ["RETRIEVER_EMBEDDING_TORCH_COMPILE"] = "false"
+from backend.retriever import get_top_k
 
 
 class TestHybridSearchFix:
     """Test hybrid search with manual vectorization and error scenarios."""
 
-    def test_retrieval_uses_local_embedding_model(self, mocker, mock_embedding_model: MagicMock):
-        """Retriever vectorizes the query locally and runs hybrid search (no BM25 fallback)."""
-        from backend.retriever import get_top_k
-
-        # encode() returns an ndarray in production; mirror that here.
-        mock_embedding_model.encode.return_value = np.array([0.1, 0.2, 0.3])
-
-        mock_client = MagicMock()
-        mocker.patch("backend.weaviate_client.get_weaviate_client", return_value=mock_client)
-        mock_collection = MagicMock()
-        mock_query = MagicMock()
-        mock_result = MagicMock()
-
-        class MockObject:
-            def __init__(self, content):
-                self.properties = {"content": content}
-
-        mock_result.objects = [MockObject("Test content 1"), MockObject("Test content 2")]
-
-        mock_client.collections.get.return_value = mock_collection
-        mock_collection.query = mock_query
-        mock_query.hybrid.return_value = mock_result
+    @pytest.mark.parametrize(
+        "texts",
+        [["Test content 1", "Test content 2"], []],
+        ids=["hits", "empty_collection"],
+    )
+    def test_retrieval_uses_local_embedding_model(self, weaviate_mock, mock_embedding_model: MagicMock, texts):
+        """Retriever vectorizes the query locally, runs hybrid search (no BM25 fallback) and returns chunk texts."""
+        query = weaviate_mock.query
+        query.hybrid.return_value = SimpleNamespace(objects=[weaviate_mock.Object(t) for t in texts])
 
         question = "test question"
         result = get_top_k(question, k=5)
 
         mock_embedding_model.encode.assert_called_once_with(question)
-        mock_query.hybrid.assert_called_once_with(
+        query.hybrid.assert_called_once_with(
             vector=[0.1, 0.2, 0.3],
             query=question,
             alpha=0.5,
             limit=5,
         )
-        mock_query.bm25.assert_not_called()
-        assert result == ["Test content 1", "Test content 2"]
+        query.bm25.assert_not_called()
+        assert result == texts
 
-    def test_retrieval_uses_explicit_embedding_model(self, mocker, mock_embedding_model: MagicMock):
+    def test_retrieval_uses_explicit_embedding_model(self, mocker, weaviate_mock, mock_embedding_model: MagicMock):
         """A caller-supplied embedding_model is used directly, without consulting the loader."""
-        from backend.retriever import get_top_k
-
         # Spy on the loader to prove it is never called when a model is supplied explicitly.
         load_embedder_spy = mocker.patch("backend.retriever.load_embedder", return_value=mock_embedding_model)
 
-        # encode() returns an ndarray in production; mirror that here.
-        mock_embedding_model.encode.return_value = np.array([0.1, 0.2, 0.3])
-
-        mock_client = MagicMock()
-        mocker.patch("backend.weaviate_client.get_weaviate_client", return_value=mock_client)
-        mock_collection = MagicMock()
-        mock_query = MagicMock()
-        mock_result = MagicMock()
-
-        class MockObject:
-            def __init__(self, content):
-                self.properties = {"content": content}
-
-        mock_result.objects = [MockObject("explicit model used")]
-        mock_client.collections.get.return_value = mock_collection
-        mock_collection.query = mock_query
-        mock_query.hybrid.return_value = mock_result
+        query = weaviate_mock.query
+        query.hybrid.return_value = SimpleNamespace(objects=[weaviate_mock.Object("explicit model used")])
 
         result = get_top_k("test question", k=1, embedding_model=mock_embedding_model)
 
         load_embedder_spy.assert_not_called()
         mock_embedding_model.encode.assert_called_once_with("test question")
-        mock_query.hybrid.assert_called_once_with(vector=[0.1, 0.2, 0.3], query="test question", alpha=0.5, limit=1)
-        mock_query.bm25.assert_not_called()
+        query.hybrid.assert_called_once_with(vector=[0.1, 0.2, 0.3], query="test question", alpha=0.5, limit=1)
+        query.bm25.assert_not_called()
         assert result == ["explicit model used"]
 
-    def test_hybrid_search_with_empty_collection(self, mocker, mock_embedding_model: MagicMock):
-        """An empty collection yields an empty result list."""
-        from backend.retriever import get_top_k
-
-        mock_client = MagicMock()
-        mocker.patch("backend.weaviate_client.get_weaviate_client", return_value=mock_client)
-        mock_collection = MagicMock()
-        mock_query = MagicMock()
-        mock_result = MagicMock()
-        mock_result.objects = []
-
-        mock_query.hybrid.return_value = mock_result
-        mock_collection.query = mock_query
-        mock_client.collections.get.return_value = mock_collection
+    def test_chunk_head_logging_at_info_level(self, caplog, weaviate_mock, mock_embedding_model: MagicMock):
+        """Each retrieved chunk's first 100 chars are logged at INFO, newlines flattened."""
+        weaviate_mock.query.hybrid.return_value = SimpleNamespace(
+            objects=[weaviate_mock.Object("short\nchunk"), weaviate_mock.Object("x" * 150)]
+        )
 
-        result = get_top_k("test question", k=5)
+        with caplog.at_level(logging.INFO, logger="backend.retriever"):
+            get_top_k("test question", k=2)
 
-        assert result == []
+        messages = [r.getMessage() for r in caplog.records if r.levelno == logging.INFO]
+        assert "Chunk 1: short chunk" in messages
+        assert f"Chunk 2: {'x' * 100}..." in messages
 
-    def test_hybrid_search_failure_raises(self, mocker, mock_embedding_model: MagicMock):
+    def test_hybrid_search_failure_raises(self, weaviate_mock, mock_embedding_model: MagicMock):
         """A hybrid-query failure raises RuntimeError and never falls back to BM25."""
-        from weaviate.exceptions import WeaviateQueryError
-
-        from backend.retriever import get_top_k
-
-        mock_client = MagicMock()
-        mocker.patch("backend.weaviate_client.get_weaviate_client", return_value=mock_client)
-        mock_collection = MagicMock()
-        mock_query = MagicMock()
-        mock_query.hybrid.side_effect = WeaviateQueryError("VectorFromInput was called without vectorizer", "GRPC")
-        mock_client.collections.get.return_value = mock_collection
-        mock_collection.query = mock_query
+        query = weaviate_mock.query
+        query.hybrid.side_effect = WeaviateQueryError("VectorFromInput was called without vectorizer", "GRPC")
 
         with pytest.raises(RuntimeError):
             get_top_k("test question", k=5)
 
-        mock_query.bm25.assert_not_called()
+        query.bm25.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ from types import ModuleType
 import pytest
 
 
-def test_startup_ensures_model_and_exits_when_missing(monkeypatch, capsys, caplog):
+def test_startup_ensures_model_and_exits_when_missing(monkeypatch, caplog):
     # Force startup checks to run: ensure the skip flag is unset
     monkeypatch.delenv("RAG_SKIP_STARTUP_CHECKS", raising=False)
 
@@ -36,25 +36,21 @@ def test_startup_ensures_model_and_exits_when_missing(monkeypatch, capsys, caplo
     monkeypatch.setitem(sys.modules, "backend.ollama_client", fake_ollama_module)
     monkeypatch.setattr(backend, "ollama_client", fake_ollama_module, raising=False)
 
-    # Ensure OLLAMA_MODEL is something stable
-    monkeypatch.setenv("OLLAMA_MODEL", "fake/model")
+    # Ensure OLLAMA_MODEL is something stable. cli reads the constant from the already
+    # imported backend.config, so patch the module attribute (an env var would be ignored).
+    monkeypatch.setattr("backend.config.OLLAMA_MODEL", "fake/model")
 
     # Make sure test path doesn't use fake_answer
     monkeypatch.delenv("RAG_FAKE_ANSWER", raising=False)
 
-    import importlib
-
+    # cli imports backend.qa_loop / backend.ollama_client lazily inside
+    # ensure_backend_ready(), so the sys.modules fakes above apply without a reload.
     import cli as cli_module
 
     # Act
     with pytest.raises(SystemExit) as exc:
-        importlib.reload(cli_module)
         cli_module.main()
 
     # Assert
     assert exc.value.code == 1
-    out_err = capsys.readouterr()
-    # Message is logged via logger; check both stderr or caplog entries
-    text = out_err.err or out_err.out
-    if "Required Ollama model" not in text:
-        assert any("Required Ollama model" in rec.message for rec in caplog.records)
+    assert any("Required Ollama model fake/model" in rec.getMessage() for rec in caplog.records)
@@ -1,38 +1,47 @@
 #!/usr/bin/env python3
 """Unit test for startup validation: importing config must not hang on input."""
 
-import logging
-import subprocess
+import importlib.util
+import io
 import sys
+import threading
 from pathlib import Path
 
 import pytest
 
-logger = logging.getLogger(__name__)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_DIR = PROJECT_ROOT / "backend"
 
 
-def test_config_import_does_not_hang():
-    """`python -m backend.config` exits cleanly and doesn't block on interactive input.
+def test_config_import_does_not_hang(monkeypatch):
+    """Executing `backend/config.py` finishes promptly and doesn't block on interactive input.
 
     Guards against a regression where module-level config code waits for stdin
     (the one failure mode here a real bug could produce; file existence, syntax,
     and attribute presence are already enforced by every other test importing the
-    package).
+    package). A fresh copy of the module is executed in-process so the check runs
+    even when `backend.config` is already in `sys.modules`; stdin is replaced with
+    an empty buffer so an accidental `input()` hits EOF instead of blocking.
     """
-    project_root = Path(__file__).resolve().parents[2]
-
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "backend.config"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            cwd=project_root,
-        )
-    except subprocess.TimeoutExpired:
+    spec = importlib.util.spec_from_file_location("_config_import_probe", BACKEND_DIR / "config.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    errors: list[BaseException] = []
+
+    def _exec() -> None:
+        try:
+            spec.loader.exec_module(module)
+        except BaseException as e:  # surfaced in the main thread below
+            errors.append(e)
+
+    monkeypatch.setattr(sys, "stdin", io.StringIO(""))
+    probe = threading.Thread(target=_exec, daemon=True)
+    probe.start()
+    probe.join(timeout=5.0)
+
+    if probe.is_alive():
         pytest.fail("Config import timed out - may be waiting for input")
-
-    assert result.returncode == 0, f"Config import failed: {result.stderr}"
+    assert not errors, f"Config import failed: {errors[0]!r}"
 
 
 if __name__ == "__main__":
@@ -1,56 +1,69 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any, Tuple
 from unittest.mock import MagicMock
 
+import pytest
 from langchain_core.documents import Document
 
-from backend.ingest import SupportsEncode, process_and_upload_chunks
+
+@pytest.fixture
+def ingest_mod():
+    """``backend.ingest``, imported on use so deselected runs don't pay for it at collection."""
+    import backend.ingest as ingest
+
+    return ingest
+
+
+# Two small documents, built once: process_and_upload_chunks only reads them.
+_DOCS = [
+    Document(page_content="hello world", metadata={"source": "tests/test_data/a.pdf"}),
+    Document(page_content="bye world", metadata={"source": "tests/test_data/b.md"}),
+]
 
 
 class DummyEmbedder:
     """A simple test double that satisfies SupportsEncode."""
 
+    # Stable, small vector shared by every call (no per-call list allocation)
+    _VEC = (0.1, 0.2, 0.3)
+
     def __init__(self) -> None:
         self.calls: int = 0
 
     # Match the protocol: first arg is positional-only for compatibility
-    def encode(self, text: str, /, *args: Any, **kwargs: Any) -> List[float]:  # pragma: no cover - exercised in test
+    def encode(self, text: str, /, *args: Any, **kwargs: Any) -> Tuple[float, ...]:  # pragma: no cover
         self.calls += 1
-        # Return a stable, small vector for test purposes
-        return [0.1, 0.2, 0.3]
+        return self._VEC
 
 
-def test_dummy_embedder_conforms_to_protocol() -> None:
+def test_dummy_embedder_conforms_to_protocol(ingest_mod) -> None:
     embedder = DummyEmbedder()
     # runtime_checkable allows isinstance checks for Protocols
-    assert isinstance(embedder, SupportsEncode)
+    assert isinstance(embedder, ingest_mod.SupportsEncode)
 
 
-def test_process_and_upload_with_protocol_impl() -> None:
-    # Arrange: mock Weaviate client/collection batch context
-    mock_client = MagicMock()
-    mock_collection = mock_client.collections.get.return_value
-    mock_batch_cm = mock_collection.batch.fixed_size.return_value
+def test_process_and_upload_with_protocol_impl(ingest_mod) -> None:
+    # Arrange: wire the client -> collection -> batch context graph explicitly
+    mock_batch_cm = MagicMock()
     mock_batch_cm.__enter__.return_value = mock_batch_cm
-
-    # Two small documents
-    docs = [
-        Document(page_content="hello world", metadata={"source": "tests/test_data/a.pdf"}),
-        Document(page_content="bye world", metadata={"source": "tests/test_data/b.md"}),
-    ]
+    mock_collection = MagicMock()
+    mock_collection.batch.fixed_size.return_value = mock_batch_cm
+    mock_client = MagicMock()
+    mock_client.collections.get.return_value = mock_collection
 
     embedder = DummyEmbedder()
 
     # Act
-    process_and_upload_chunks(mock_client, docs, embedder, "test_collection")
+    ingest_mod.process_and_upload_chunks(mock_client, _DOCS, embedder, "test_collection")
 
     # Assert: embedder was used and batch add_object called per doc
-    assert embedder.calls == len(docs)
+    assert embedder.calls == len(_DOCS)
+    mock_client.collections.get.assert_called_once_with("test_collection")
     assert mock_collection.batch.fixed_size.call_count == 1
-    assert mock_batch_cm.add_object.call_count == len(docs)
+    assert mock_batch_cm.add_object.call_count == len(_DOCS)
 
-    # Check that vectors from the embedder are passed through
+    # Check that vectors from the embedder are passed through, normalized to list[float]
     _, first_kwargs = mock_batch_cm.add_object.call_args_list[0]
     assert first_kwargs["vector"] == [0.1, 0.2, 0.3]
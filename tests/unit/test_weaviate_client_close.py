@@ -1,37 +1,53 @@
+import pytest
+
 import backend.qa_loop as qa_loop
 
+# Captured at import, before the autouse conftest fixture swaps the wrapper for a fake.
+from backend.weaviate_client import get_weaviate_client as _real_get_weaviate_client
+
+
+class _ReadyCollections:
+    def exists(self, name: str) -> bool:
+        return True
+
+
+class _ReadyWeaviateClient:
+    """Connected, ready client whose collection already exists; records ``close()``."""
 
-def test_ensure_weaviate_ready_and_populated_closes_client(monkeypatch):
-    class FakeCollections:
-        def exists(self, name: str) -> bool:
-            return True
+    def __init__(self) -> None:
+        self.closed = False
+        self.collections = _ReadyCollections()
 
-    class FakeClient:
-        def __init__(self):
-            self.closed = False
+    def is_ready(self) -> bool:
+        return True
 
-        def is_ready(self):
-            return True
+    def is_connected(self) -> bool:
+        return True
 
-        @property
-        def collections(self):
-            return FakeCollections()
+    def close(self) -> None:
+        self.closed = True
 
-        def is_connected(self) -> bool:
-            return True
 
-        def close(self) -> None:
-            self.closed = True
+@pytest.fixture
+def fake_weaviate_client() -> _ReadyWeaviateClient:
+    return _ReadyWeaviateClient()
 
-    fake_client = FakeClient()
 
-    # Monkeypatch the centralized weaviate client getter used by the function
-    monkeypatch.setattr("backend.weaviate_client.get_weaviate_client", lambda: fake_client, raising=True)
-    # Ensure the wrapper cache points at our fake so the wrapper's closer closes it
-    monkeypatch.setattr("backend.weaviate_client._client", fake_client, raising=True)
+@pytest.mark.parametrize("patch_target", ["wrapper", "factory"])
+def test_ensure_weaviate_ready_and_populated_closes_client(monkeypatch, fake_weaviate_client, patch_target):
+    if patch_target == "wrapper":
+        # Monkeypatch the centralized weaviate client getter used by the function
+        monkeypatch.setattr("backend.weaviate_client.get_weaviate_client", lambda: fake_weaviate_client, raising=True)
+        # Ensure the wrapper cache points at our fake so the wrapper's closer closes it
+        monkeypatch.setattr("backend.weaviate_client._client", fake_weaviate_client, raising=True)
+    else:
+        # Run the real wrapper and fake only the connection factory, so the wrapper's
+        # own cache -> close_weaviate_client() path is exercised end to end.
+        monkeypatch.setattr("backend.weaviate_client.get_weaviate_client", _real_get_weaviate_client, raising=True)
+        monkeypatch.setattr("weaviate.connect_to_custom", lambda **_kwargs: fake_weaviate_client, raising=True)
 
     # Run the function under test
     qa_loop.ensure_weaviate_ready_and_populated()
 
     # Verify client was closed in the finally block
-    assert fake_client.closed is True
+    assert fake_weaviate_client.closed is True